@@ -25,7 +25,7 @@ import serial.tools.list_ports
 
 from utils import exit_script, data_log
 
-def run_telnet_server_thread(srv_ip_address: str, srv_port: str, nmea_obj) -> None:
+def run_telnet_server_thread(srv_ip_address: str, srv_port: str, nmea_obj, status_callback=None) -> None:
     """
     Method starts thread with TCP (telnet) server sending NMEA
     data to connected client (clients).
@@ -33,6 +33,7 @@ def run_telnet_server_thread(srv_ip_address: str, srv_port: str, nmea_obj) -> No
     :param str srv_ip_address: String with IP address
     :param str srv_port: String with port
     :param object nmea_obj: NmeaMsg object
+    :param function status_callback: Optional function receiving status dictionaries
     :return: None
     :rtype: None
     """
@@ -61,7 +62,8 @@ def run_telnet_server_thread(srv_ip_address: str, srv_port: str, nmea_obj) -> No
                                                 daemon=True,
                                                 conn=conn,
                                                 ip_add=ip_add,
-                                                nmea_object=nmea_obj)
+                                                nmea_object=nmea_obj,
+                                                status_callback=status_callback)
                 nmea_srv_thread.start()
             else:
                 # Close connection if number of scheduler jobs > max_sched_jobs
@@ -72,12 +74,13 @@ class NmeaSrvThread(threading.Thread):
     """
     A class that represents a thread dedicated for TCP (telnet) server-client connection.
     """
-    def __init__(self, nmea_object, ip_add=None, conn=None, *args, **kwargs):
+    def __init__(self, nmea_object, ip_add=None, conn=None, status_callback=None, *args, **kwargs):
         """ Class constructor
 
         :param object nmea_object: NmeaMsg object
         :param str ip_add: String with IP address
         :param str conn: Unknown function of argument
+        :param function status_callback: Optional function receiving status dictionaries
         :param tuple *args: Additional arguments in tuple
         :param dict **kwargs: Additional arguments in a dictionary
         """
@@ -95,6 +98,8 @@ class NmeaSrvThread(threading.Thread):
         self.conn = conn
         self.ip_add = ip_add
         self.nmea_object = nmea_object
+        self.status_callback = status_callback
+        self._status_time = 0.0
         self._lock = threading.RLock()
 
     def set_speed(self, new_speed):
@@ -120,6 +125,28 @@ class NmeaSrvThread(threading.Thread):
 
     def get_altitude(self):
         return self.nmea_object.altitude
+
+    def publish_status(self):
+        """
+        Pushes the unit's current values to the status callback,
+        at most once per second.
+        """
+        if self.status_callback is None:
+            return
+        now = time.monotonic()
+        if now - self._status_time < 1:
+            return
+        self._status_time = now
+        self.status_callback({
+            'lat': self.nmea_object.position['lat'],
+            'lng': self.nmea_object.position['lng'],
+            'altitude': self.nmea_object.altitude,
+            'heading': self.nmea_object.heading,
+            'speed': self.nmea_object.speed,
+            'magvar_dec': self.nmea_object.magvar_dec,
+            # Unit the values belong to
+            'source': self.nmea_object
+        })
     
     def run(self):
         while True:
@@ -146,6 +173,7 @@ class NmeaSrvThread(threading.Thread):
                     nmea_list = [f'{_}' for _ in self.nmea_object.nmea_sentences]
                 else:
                     nmea_list = [f'{_}' for _ in next(self.nmea_object)]
+                    self.publish_status()
                 try:
                     for nmea in nmea_list:
                         self.conn.sendall(nmea.encode())
@@ -199,6 +227,7 @@ class NmeaStreamThread(NmeaSrvThread):
                                 self._altitude_cache = self.altitude
                                 self._altitude_change = False
                             nmea_list = [f'{_}' for _ in next(self.nmea_object)]
+                            self.publish_status()
                             for nmea in nmea_list:
                                 s.send(nmea.encode())
                                 time.sleep(0.05)
@@ -228,6 +257,7 @@ class NmeaStreamThread(NmeaSrvThread):
                             self._altitude_cache = self.altitude
                             self._altitude_change = False
                         nmea_list = [f'{_}' for _ in next(self.nmea_object)]
+                        self.publish_status()
                         for nmea in nmea_list:
                             try:
                                 s.sendto(nmea.encode(), (self.ip_add, self.port))
@@ -284,6 +314,7 @@ class NmeaSerialThread(NmeaSrvThread):
                             self._altitude_change = False
                         # Get list of NMEA messages and send to port
                         nmea_list = [f'{_}' for _ in next(self.nmea_object)]
+                        self.publish_status()
                         for nmea in nmea_list:
                             ser.write(str.encode(nmea))
                             time.sleep(0.05)
@@ -334,6 +365,7 @@ class NmeaOutputThread(NmeaSrvThread):
                         self._altitude_change = False
                     # Create list of NMEA sentences
                     nmea_list = [f'{_}' for _ in next(self.nmea_object)]
+                    self.publish_status()
                     # Loop through list and log to file
                     for nmea in nmea_list:
                         # Check filter
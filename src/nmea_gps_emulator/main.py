@@ -131,9 +131,9 @@ class Application:
                     sys.exit()
                 if prompt == '':
                     # Get active values
-                    old_heading = self.nmea_obj.get_heading
-                    old_speed = self.nmea_obj.get_speed
-                    old_altitude = self.nmea_obj.get_altitude
+                    old_heading = self.nmea_obj.heading
+                    old_speed = self.nmea_obj.speed
+                    old_altitude = self.nmea_obj.altitude
                     # Get new values from user
                     new_heading = change_heading_input(self, old_heading)
                     new_speed = change_speed_input(self, old_speed)
@@ -218,9 +218,9 @@ class Application:
                     sys.exit()
                 if prompt == '':
                     # Get active values
-                    old_heading = self.nmea_obj.get_heading
-                    old_speed = self.nmea_obj.get_speed
-                    old_altitude = self.nmea_obj.get_altitude
+                    old_heading = self.nmea_obj.heading
+                    old_speed = self.nmea_obj.speed
+                    old_altitude = self.nmea_obj.altitude
                     # Get new values from user
                     new_heading = change_heading_input(self, old_heading)
                     new_speed = change_speed_input(self, old_speed)
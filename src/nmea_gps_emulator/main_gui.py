@@ -10,7 +10,6 @@ Created in 2024
 :license: MIT
 """
 
-import time
 import sys
 import threading
 import uuid
@@ -18,10 +17,12 @@ import argparse
 import os
 import json
 import re
+from functools import partial
 
 import serial.tools.list_ports
 
-from PySide6.QtCore import QTimer, QRegularExpression, QLocale
+from PySide6.QtCore import (QObject, QRunnable, QThreadPool, QTimer,
+        QRegularExpression, QLocale, Qt, Signal)
 
 from PySide6.QtWidgets import (QApplication, QButtonGroup, QComboBox, 
         QDialog, QFormLayout, QGridLayout, QGroupBox, QLabel, QLineEdit,
@@ -31,7 +32,6 @@ from PySide6.QtWidgets import (QApplication, QButtonGroup, QComboBox,
 from PySide6.QtGui import QDoubleValidator, QIntValidator, QRegularExpressionValidator
 
 from nmea_gps import NmeaMsg
-from nmea_utils import ddd2nmeall
 from utils import get_ip
 
 from custom_thread import NmeaStreamThread, NmeaSerialThread, NmeaOutputThread, run_telnet_server_thread
@@ -39,6 +39,129 @@ from custom_thread import NmeaStreamThread, NmeaSerialThread, NmeaOutputThread,
 __location__ = os.path.realpath(
     os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
+# Validator expressions, compiled once and shared by all fields
+_IP_PATTERN = r'''
+        \b                      # Word boundary
+        (                       # Start of the first capturing group
+            (?:                   # Non-capturing group for the first 3 octets
+            25[0-5]|            # Match 250-255
+            2[0-4][0-9]|        # Match 200-249
+            1[0-9][0-9]|        # Match 100-199
+            [1-9]?[0-9]         # Match 0-99 (including leading zeros)
+        )
+        \.                    # Literal dot
+        ){3}                    # Repeat the non-capturing group 3 times
+        (                       # Start of the fourth octet
+            25[0-5]|              # Match 250-255
+            2[0-4][0-9]|          # Match 200-249
+            1[0-9][0-9]|          # Match 100-199
+            [1-9]?[0-9]           # Match 0-99 (including leading zeros)
+        )
+        \b                      # Word boundary
+        '''
+_IP_RE = QRegularExpression(_IP_PATTERN, QRegularExpression.ExtendedPatternSyntaxOption)
+_IP_RE.optimize()
+_PORT_RE = QRegularExpression(r'([1-9][0-9]{0,3}|[1-6][0-5]{2}[0-3][0-5])')
+_PORT_RE.optimize()
+
+# Static settings shared by all dialogs
+_LOCALE_EN = QLocale(QLocale.English, QLocale.UnitedStates)
+_MODES = ('NMEA Serial Output', 'NMEA TCP Server', 'NMEA Stream (UDP)',
+          'NMEA Stream (TCP)', 'NMEA Logging')
+_BAUDRATES = ('300', '600', '1200', '2400', '4800', '9600', '14400',
+              '19200', '38400', '57600', '115200', '128000')
+_FILTERS = (
+    ('1', '$GPGGA'),
+    ('2', '$GPGLL'),
+    ('3', '$GPRMC'),
+    ('4', '$GPGSA'),
+    ('5', '$GPGSV'),
+    ('6', '$GPHDT'),
+    ('7', '$GPVTG'),
+    ('8', '$GPZDA'),
+    ('0', 'None')
+)
+_DEFAULT_SERIAL = {
+    'setup_ok': False,
+    'port': '/dev/ttyS0',
+    'baudrate': 9600,
+    'bytesize': 8,
+    'parity': 'N',
+    'stopbits': 1,
+    'timeout': 1
+}
+_DEFAULT_NETWORK = {
+    'setup_ok': False,
+    'ip_srv': '127.0.0.1',
+    'port_srv': 10110,
+    'ip_str': '127.0.0.1',
+    'port_str': 10110
+}
+
+def scan_serial_ports() -> list:
+    """
+    The method lists the device names of the connected serial ports.
+
+    :return: sorted list of serial device names
+    :rtype: list
+    """
+    ports_connected = serial.tools.list_ports.comports(include_links=False)
+    return sorted(port.device for port in ports_connected)
+
+class _JobSignals(QObject):
+    """
+    Signals emitted by a background job, delivered queued to the GUI thread.
+    """
+    result = Signal(object)
+
+class _BackgroundJob(QRunnable):
+    """
+    Runs a blocking function in the global thread pool and emits its result.
+    """
+    def __init__(self, func, *args, empty=None):
+        """ Class constructor
+
+        :param function func: blocking function to run
+        :param tuple *args: arguments to the function
+        :param object empty: result emitted if the function fails, defaults to None
+        """
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.empty = empty
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as error:
+            # The slot still has to replace its placeholder
+            print(f'Background job error: {error}')
+            result = self.empty
+        self.signals.result.emit(result)
+
+class _StatusBridge(QObject):
+    """
+    Carries status dictionaries pushed by the output threads to the GUI thread.
+    """
+    status_changed = Signal(object)
+
+def run_in_background(func, slot, *args, empty=None) -> None:
+    """
+    The method runs a blocking function off the GUI thread and hands
+    the result to the given slot.
+
+    :param function func: blocking function to run
+    :param function slot: slot receiving the result in the GUI thread
+    :param tuple *args: arguments to the function
+    :param object empty: result handed to the slot if the function fails, defaults to None
+    :return: None
+    :rtype: None
+    """
+    job = _BackgroundJob(func, *args, empty=empty)
+    job.signals.result.connect(slot)
+    QThreadPool.globalInstance().start(job)
+
 class NmeaGuiApplication(QDialog):
     """
     Display a gui windows with settings and run.
@@ -47,28 +170,25 @@ class NmeaGuiApplication(QDialog):
 
         super(NmeaGuiApplication, self).__init__(parent)
 
-        self.locale_en = QLocale(QLocale.English, QLocale.UnitedStates)
-
         self.nmea_thread = None
         self.nmea_obj = None
+        # Output threads accepting heading, speed and altitude updates
+        self._nmea_workers: list[threading.Thread] = []
+        # Last texts written to the status labels
+        self._last_status: tuple | None = None
+        # Status pushed from the output threads
+        self._status_active = False
+        self._status_bridge = _StatusBridge()
+        self._status_bridge.status_changed.connect(self._apply_status, Qt.QueuedConnection)
+        # Delayed start of the output, cancelled by stop
+        self._start_timer = QTimer(self)
+        self._start_timer.setSingleShot(True)
+        self._start_timer.setInterval(1000)
+        self._start_timer.timeout.connect(self._run_continue)
 
         self.mode_select = 0
-        self.serial_set = {
-            'setup_ok': False,
-            'port': '/dev/ttyS0',
-            'baudrate': 9600,
-            'bytesize': 8,
-            'parity': 'N',
-            'stopbits': 1,
-            'timeout': 1
-        }
-        self.network_set = {
-            'setup_ok': False,
-            'ip_srv': '127.0.0.1',
-            'port_srv': 10110,
-            'ip_str': '127.0.0.1',
-            'port_str': 10110
-        }
+        self.serial_set = dict(_DEFAULT_SERIAL)
+        self.network_set = dict(_DEFAULT_NETWORK)
         self.pos_data_dict = {
             'latitude_value': 57.70011131,
             'latitude_nmea_value': '',
@@ -83,17 +203,6 @@ class NmeaGuiApplication(QDialog):
             'altitude_amsl': 42,
             'position': self.pos_data_dict
         }
-        self.filters_dict = {
-            '1': '$GPGGA',
-            '2': '$GPGLL',
-            '3': '$GPRMC',
-            '4': '$GPGSA',
-            '5': '$GPGSV',
-            '6': '$GPHDT',
-            '7': '$GPVTG',
-            '8': '$GPZDA',
-            '0': 'None'
-        }
         self.filter_mess = ''
         self.poi_list = {}
 
@@ -115,10 +224,6 @@ class NmeaGuiApplication(QDialog):
         self.create_statusgroupbox()
         self.create_poigroupbox()
 
-        # Create timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
-        
         # Create start and stop buttons
         self.start_button = QPushButton("Start", self)
         self.start_button.resize(10,30)
@@ -163,11 +268,8 @@ class NmeaGuiApplication(QDialog):
 
         self.mode_combo_box = QComboBox(self)
         self.mode_combo_box.width = 100
-        self.mode_combo_box.addItem("NMEA Serial Output", userData=0)
-        self.mode_combo_box.addItem("NMEA TCP Server", userData=1)
-        self.mode_combo_box.addItem("NMEA Stream (UDP)", userData=2)
-        self.mode_combo_box.addItem("NMEA Stream (TCP)", userData=3)
-        self.mode_combo_box.addItem("NMEA Logging", userData=4)
+        for mode, mode_label in enumerate(_MODES):
+            self.mode_combo_box.addItem(mode_label, userData=mode)
         self.mode_combo_box.currentIndexChanged.connect(self.update_mode)
 
         layout = QFormLayout()
@@ -202,19 +304,17 @@ class NmeaGuiApplication(QDialog):
         self.serialgroupbox = QGroupBox("Serial ports:")
 
         # Create combo box with available serial ports
+        # The port scan may block, so it runs in the thread pool
         self.serial_list_combo_box = QComboBox(self)
-        ports_connected = serial.tools.list_ports.comports(include_links=False)
-        for device, desc, hwid in sorted(ports_connected):
-            self.serial_list_combo_box.addItem(f'{device}')
+        self.serial_list_combo_box.addItem('Scanning…')
+        run_in_background(scan_serial_ports, self.set_serial_ports, empty=[])
         self.serial_select_label = QLabel("-", self)
         self.serial_select_label.width = 120
         self.serial_list_combo_box.currentIndexChanged.connect(self.check_valid_serial)
 
         # Create a combo box with all baud rates
         self.baudrates_combo_box = QComboBox(self)
-        baudrate_list = ['300', '600', '1200', '2400', '4800', '9600', '14400',
-                     '19200', '38400', '57600', '115200', '128000']
-        self.baudrates_combo_box.addItems(baudrate_list)
+        self.baudrates_combo_box.addItems(_BAUDRATES)
         default_baud_rate = "9600"
         self.baudrates_combo_box.setCurrentText(default_baud_rate)
         self.baudrates_combo_box.currentIndexChanged.connect(self.check_valid_serial)
@@ -226,6 +326,18 @@ class NmeaGuiApplication(QDialog):
         layout.addStretch(1)
         self.serialgroupbox.setLayout(layout)
 
+    def set_serial_ports(self, ports: list):
+        # Replace the placeholder without triggering a port selection
+        self.serial_list_combo_box.blockSignals(True)
+        self.serial_list_combo_box.clear()
+        self.serial_list_combo_box.addItems(ports)
+        self.serial_list_combo_box.blockSignals(False)
+        # A selection made during the scan stored the placeholder as port
+        if not ports:
+            self.serial_set['setup_ok'] = False
+        elif self.serial_set['setup_ok']:
+            self.check_valid_serial()
+
     def check_valid_serial(self):
         serial_select = self.serial_list_combo_box.currentText()
         baudrate_select = self.baudrates_combo_box.currentText()
@@ -278,70 +390,43 @@ class NmeaGuiApplication(QDialog):
     def create_networkgroupbox(self):
         self.networkgroupbox = QGroupBox("Networking:")
 
-        ipa_pattern = r'''
-            \b                      # Word boundary
-            (                       # Start of the first capturing group
-                (?:                   # Non-capturing group for the first 3 octets
-                25[0-5]|            # Match 250-255
-                2[0-4][0-9]|        # Match 200-249
-                1[0-9][0-9]|        # Match 100-199
-                [1-9]?[0-9]         # Match 0-99 (including leading zeros)
-            )
-            \.                    # Literal dot
-            ){3}                    # Repeat the non-capturing group 3 times
-            (                       # Start of the fourth octet
-                25[0-5]|              # Match 250-255
-                2[0-4][0-9]|          # Match 200-249
-                1[0-9][0-9]|          # Match 100-199
-                [1-9]?[0-9]           # Match 0-99 (including leading zeros)
-            )
-            \b                      # Word boundary
-            '''
-
-        ip_regex = QRegularExpression(ipa_pattern, QRegularExpression.ExtendedPatternSyntaxOption)
-
         self.ip_srv_txt = QLineEdit(self)
         self.ip_srv_txt.width = 60
         self.ip_srv_txt.setToolTip('Local IP address to use when running a TCP server')
-        ipal_txt_validator = QRegularExpressionValidator(ip_regex, self.ip_srv_txt)
+        ipal_txt_validator = QRegularExpressionValidator(_IP_RE, self.ip_srv_txt)
         self.ip_srv_txt.setValidator(ipal_txt_validator)
-        self.ip_srv_txt.setText(get_ip())
-        self.ip_srv_txt.textChanged.connect(self.check_valid_network)
+        # The local IP lookup may block, so it runs in the thread pool
+        self.ip_srv_txt.setPlaceholderText('Scanning…')
+        run_in_background(get_ip, self.set_server_ip, empty='')
         self.ip_srv_txt.textEdited.connect(self.check_valid_network)
 
         self.port_srv_txt = QLineEdit(self)
         self.port_srv_txt.width = 60
         self.port_srv_txt.setToolTip('Port, used for server')
-        ipp_input_validator = QRegularExpressionValidator(
-            QRegularExpression(R'''([1-9][0-9]{0,3}|[1-6][0-5]{2}[0-3][0-5])'''),
-                self.port_srv_txt
-        )
+        ipp_input_validator = QRegularExpressionValidator(_PORT_RE, self.port_srv_txt)
         self.port_srv_txt.setValidator(ipp_input_validator)
-        self.port_srv_txt.setText(f"{self.network_set['port_srv']}")
-        self.port_srv_txt.textChanged.connect(self.check_valid_network)
+        self.port_srv_txt.setText(str(self.network_set['port_srv']))
         self.port_srv_txt.textEdited.connect(self.check_valid_network)
 
         self.ip_str_txt = QLineEdit(self)
         self.ip_str_txt.width = 60
         self.ip_str_txt.setToolTip('Remote IP address used to send messages to')
-        ipar_txt_validator = QRegularExpressionValidator(ip_regex, self.ip_str_txt)
+        ipar_txt_validator = QRegularExpressionValidator(_IP_RE, self.ip_str_txt)
         self.ip_str_txt.setValidator(ipar_txt_validator)
-        self.ip_str_txt.setText(f"{self.network_set['ip_str']}")
-        self.ip_str_txt.textChanged.connect(self.check_valid_network)
+        self.ip_str_txt.setText(self.network_set['ip_str'])
         self.ip_str_txt.textEdited.connect(self.check_valid_network)
 
         self.port_str_txt = QLineEdit(self)
         self.port_str_txt.width = 60
         self.port_str_txt.setToolTip('Port, used for stream')
-        ipp_input_validator = QRegularExpressionValidator(
-            QRegularExpression(R'''([1-9][0-9]{0,3}|[1-6][0-5]{2}[0-3][0-5])'''),
-                self.port_str_txt
-        )
+        ipp_input_validator = QRegularExpressionValidator(_PORT_RE, self.port_str_txt)
         self.port_str_txt.setValidator(ipp_input_validator)
-        self.port_str_txt.setText(f"{self.network_set['port_str']}")
-        self.port_str_txt.textChanged.connect(self.check_valid_network)
+        self.port_str_txt.setText(str(self.network_set['port_str']))
         self.port_str_txt.textEdited.connect(self.check_valid_network)
 
+        # Fields validated together in check_valid_network
+        self._net_fields = (self.ip_srv_txt, self.ip_str_txt, self.port_srv_txt, self.port_str_txt)
+
         layout = QFormLayout()
         layout.addRow('Local IP:', self.ip_srv_txt)
         layout.addRow('Server port:', self.port_srv_txt)
@@ -349,57 +434,64 @@ class NmeaGuiApplication(QDialog):
         layout.addRow('Stream port:', self.port_str_txt)
         self.networkgroupbox.setLayout(layout)
     
+    def set_server_ip(self, ip: str):
+        self.ip_srv_txt.setPlaceholderText('')
+        # Keep an address the user typed while the lookup was running
+        if not self.ip_srv_txt.text():
+            self.ip_srv_txt.setText(ip)
+        self.check_valid_network()
+
     def check_valid_network(self):
         self.network_set['setup_ok'] = False
-        if self.ip_srv_txt.hasAcceptableInput() \
-            and self.ip_str_txt.hasAcceptableInput() \
-            and self.port_srv_txt.hasAcceptableInput() \
-            and self.port_str_txt.hasAcceptableInput():
+        if all(field.hasAcceptableInput() for field in self._net_fields):
             self.network_set['setup_ok'] = True
-            self.network_set['ip_srv'] = self.ip_srv_txt
-            self.network_set['port_srv'] = self.port_srv_txt
-            self.network_set['ip_stream'] = self.ip_str_txt
-            self.network_set['port_stream'] = self.port_str_txt
+            self.network_set['ip_srv'] = self.ip_srv_txt.text()
+            self.network_set['port_srv'] = int(self.port_srv_txt.text())
+            self.network_set['ip_str'] = self.ip_str_txt.text()
+            self.network_set['port_str'] = int(self.port_str_txt.text())
 
     def create_positiongroupbox(self):
         self.positiongroupbox = QGroupBox("Position:")
 
         self.lat_txt = QLineEdit(self)
         self.lat_txt.width = 60
-        self.lat_txt.setText(str(self.nav_data_dict['position']['latitude_value']))
         self.lat_txt.setToolTip(f'Latitude in degrees, negative if on the southern hemisphere')
         lat_validator = QDoubleValidator(-89.9999999, 89.9999999, 8, self)
-        lat_validator.setLocale(self.locale_en)
+        lat_validator.setLocale(_LOCALE_EN)
         self.lat_txt.setValidator(lat_validator)
+        self.lat_txt.setText(str(self.nav_data_dict['position']['latitude_value']))
 
         self.lng_txt = QLineEdit(self)
         self.lng_txt.width = 60
-        self.lng_txt.setText(str(self.nav_data_dict['position']['longitude_value']))
         self.lng_txt.setToolTip(f'Longitude in degrees, negative if west of Greenwich, London')
         lng_validator = QDoubleValidator(-179.99999999, 179.99999999, 8, self)
-        lng_validator.setLocale(self.locale_en)
+        lng_validator.setLocale(_LOCALE_EN)
         self.lng_txt.setValidator(lng_validator)
+        self.lng_txt.setText(str(self.nav_data_dict['position']['longitude_value']))
 
         self.alt_txt = QLineEdit(self)
         self.alt_txt.width = 60
-        self.alt_txt.setText(str(self.nav_data_dict['altitude_amsl']))
         self.alt_txt.setToolTip(f'Altitude in meters above sea level')
         alt_validator = QIntValidator(-400, 9000, self)
+        alt_validator.setLocale(_LOCALE_EN)
         self.alt_txt.setValidator(alt_validator)
+        self.alt_txt.setText(str(self.nav_data_dict['altitude_amsl']))
 
         self.speed_txt = QLineEdit(self)
         self.speed_txt.width = 60
-        self.speed_txt.setText(str(self.nav_data_dict['speed']))
         self.speed_txt.setToolTip(f'Speed in knots')
         speed_validator = QIntValidator(0, 200, self)
+        speed_validator.setLocale(_LOCALE_EN)
         self.speed_txt.setValidator(speed_validator)
+        self.speed_txt.setText(str(self.nav_data_dict['speed']))
 
         self.head_txt = QLineEdit(self)
         self.head_txt.width = 60
-        self.head_txt.setText(str(self.nav_data_dict['heading']))
         self.head_txt.setToolTip(f'Heading in degrees')
         head_validator = QIntValidator(0, 359, self)
+        head_validator.setLocale(_LOCALE_EN)
         self.head_txt.setValidator(head_validator)
+        self.head_txt.setText(str(self.nav_data_dict['heading']))
 
         layout = QFormLayout()
         layout.addRow('Lat:',self.lat_txt)
@@ -425,32 +517,39 @@ class NmeaGuiApplication(QDialog):
         self.alt_up_button = QPushButton("Alt +", self)
         self.alt_up_button.resize(10,20)
         self.alt_up_button.setToolTip(f'Increase altitude by 1')
-        self.alt_up_button.clicked.connect(self.updateAltPlus)
 
         self.alt_dn_button = QPushButton("Alt -", self)
         self.alt_dn_button.resize(10,20)
         self.alt_dn_button.setToolTip(f'Decrease altitude by 1')
-        self.alt_dn_button.clicked.connect(self.updateAltMinus)
 
         self.head_plus_button = QPushButton("Right", self)
         self.head_plus_button.resize(10,20)
         self.head_plus_button.setToolTip(f'Turn right by 1 degree')
-        self.head_plus_button.clicked.connect(self.updateHeadPlus)
 
         self.head_minus_button = QPushButton("Left", self)
         self.head_minus_button.resize(10,20)
         self.head_minus_button.setToolTip(f'Turn left by 1 degree')
-        self.head_minus_button.clicked.connect(self.updateHeadMinus)
 
         self.speed_minus_button = QPushButton("Speed -", self)
         self.speed_minus_button.resize(10,30)
         self.speed_minus_button.setToolTip(f'Decrease speed by 1')
-        self.speed_minus_button.clicked.connect(self.updateSpeedMinus)
 
         self.speed_plus_button = QPushButton("Speed +", self)
         self.speed_plus_button.resize(10,30)
         self.speed_plus_button.setToolTip(f'Increase speed by 1')
-        self.speed_plus_button.clicked.connect(self.updateSpeedPlus)
+
+        # A held button repeats its step, applied as one change on release
+        self._bump_pending = None
+        self._bump_timer = QTimer(self)
+        self._bump_timer.timeout.connect(self._repeat_bump)
+        for button, attr, delta in ((self.alt_up_button, 'altitude_targeted', 1),
+                                    (self.alt_dn_button, 'altitude_targeted', -1),
+                                    (self.head_plus_button, 'heading_targeted', 1),
+                                    (self.head_minus_button, 'heading_targeted', -1),
+                                    (self.speed_plus_button, 'speed_targeted', 1),
+                                    (self.speed_minus_button, 'speed_targeted', -1)):
+            button.pressed.connect(partial(self._start_bump, attr, delta))
+            button.released.connect(self._flush_bump)
 
         controls_grid = QGridLayout()
         controls_grid.addWidget(self.alt_up_button, 0, 1)
@@ -470,7 +569,7 @@ class NmeaGuiApplication(QDialog):
         filter_stack = QFormLayout()
         self.filter_button_group = QButtonGroup(self)
 
-        for key, option in self.filters_dict.items():
+        for key, option in _FILTERS:
             
             filter_radio_button = QRadioButton(option)
             self.filter_button_group.addButton(filter_radio_button)
@@ -488,7 +587,7 @@ class NmeaGuiApplication(QDialog):
         key = filters_button.property('key')
         filter = filters_button.property('filter')
         # print(f"Selected: {filter} with value {key}")
-        if key == 0:
+        if key == '0':
             self.filter_mess = ''
         else:
             self.filter_mess = filter
@@ -528,13 +627,27 @@ class NmeaGuiApplication(QDialog):
 
         self.statusgroupbox.setLayout(status_stack)
 
-    def update_status(self):
-        self.status_lat_label.setText(f"Latitude: {str(self.nmea_obj.position['latitude_value'])}°")
-        self.status_lng_label.setText(f"Longitude: {str(self.nmea_obj.position['longitude_value'])}°")
-        self.status_speed_label.setText(f"Speed: {str(self.nmea_obj.speed)} kt")
-        self.status_alt_label.setText(f"Altitude: {str(self.nmea_obj.altitude)} msl")
-        self.status_head_label.setText(f"Heading: {str(self.nmea_obj.heading)}°")
-        self.status_magvar_label.setText(f"M: {self.nmea_obj.magvar_dec:.3f}°")
+        # Labels in the order of the texts built in _apply_status
+        self._status_labels = (self.status_lat_label, self.status_lng_label,
+                               self.status_alt_label, self.status_head_label,
+                               self.status_speed_label, self.status_magvar_label)
+
+    def _apply_status(self, values: dict):
+        # Output threads of a stopped unit keep pushing, show the current unit only
+        if not self._status_active or values['source'] is not self.nmea_obj:
+            return
+        status = (f"Latitude: {values['lat']}°",
+                  f"Longitude: {values['lng']}°",
+                  f"Altitude: {values['altitude']} msl",
+                  f"Heading: {values['heading']}°",
+                  f"Speed: {values['speed']} kt",
+                  f"M: {values['magvar_dec']:.3f}°")
+        last_status = self._last_status or (None,) * len(status)
+        # Only repaint labels with changed text
+        for label, text, last_text in zip(self._status_labels, status, last_status):
+            if text != last_text:
+                label.setText(text)
+        self._last_status = status
 
     def run(self):
         """
@@ -562,88 +675,95 @@ class NmeaGuiApplication(QDialog):
 
         if ready_to_run:
 
-            nav_data_dict = {
-                'speed': float(self.speed_txt.text()),
-                'heading': float(self.head_txt.text()),
-                'altitude_amsl': float(self.alt_txt.text()),
-                'position': {}
+            # Parse each field once
+            lat = float(self.lat_txt.text())
+            lng = float(self.lng_txt.text())
+            altitude = float(self.alt_txt.text())
+            speed = float(self.speed_txt.text())
+            heading = float(self.head_txt.text())
+
+            # NMEA formatted position and directions are added by NmeaMsg
+            position_dict = {
+                'lat': lat,
+                'lng': lng
             }
-            pos_data_dict = {
-                'latitude_value': float(self.lat_txt.text()),
-                'latitude_nmea_value': ddd2nmeall(float(self.lat_txt.text()), 'lat'),
-                'latitude_direction': 'N',
-                'longitude_value': float(self.lng_txt.text()),
-                'longitude_nmea_value': ddd2nmeall(float(self.lng_txt.text()), 'lng'),
-                'longitude_direction': 'E'
-            }
-            nav_data_dict['position'] = pos_data_dict
-
-            self.nmea_obj = NmeaMsg(position=nav_data_dict['position'],
-                                    altitude=nav_data_dict['altitude_amsl'],
-                                    speed=nav_data_dict['speed'],
-                                    heading=nav_data_dict['heading'])
-        
-            time.sleep(1)
-
-            self.controlsgroupbox.setEnabled(True)
-            self.positiongroupbox.setDisabled(True)
-
-            self.update_timer.start(1000)
-
-            match self.mode_select:
-                case 0: # Serial
-                    self.nmea_serial()
-                case 1: # TCP Server
-                    self.nmea_tcp_server()
-                case 2: # Stream UDP
-                    self.nmea_stream('UDP')
-                case 3: # Stream TCP
-                    self.nmea_stream('TCP')
-                case 4: # Logging
-                    self.nmea_logging()
-                case _:
-                    sys.exit(0)
+
+            self.nmea_obj = NmeaMsg(position_init=position_dict,
+                                    altitude_init=altitude,
+                                    speed_init=speed,
+                                    heading_init=heading,
+                                    verbose=False)
+
+            # Start output after 1 sec without blocking the event loop
+            self.start_button.setDisabled(True)
+            self._start_timer.start()
         else:
             not_ready_message = QMessageBox()
             not_ready_message.setText("Check your settings...")
             not_ready_message.exec()
 
+    def _run_continue(self):
+        """
+        Enable the controls and start the output thread for the selected mode.
+        """
+        self.start_button.setEnabled(True)
+        self.controlsgroupbox.setEnabled(True)
+        self.positiongroupbox.setDisabled(True)
+
+        self._status_active = True
+        self._last_status = None
+
+        match self.mode_select:
+            case 0: # Serial
+                self.nmea_serial()
+            case 1: # TCP Server
+                self.nmea_tcp_server()
+            case 2: # Stream UDP
+                self.nmea_stream('UDP')
+            case 3: # Stream TCP
+                self.nmea_stream('TCP')
+            case 4: # Logging
+                self.nmea_logging()
+            case _:
+                sys.exit(0)
+
     def stop(self):
+        # Cancel a pending start
+        self._start_timer.stop()
+        self.start_button.setEnabled(True)
         self.controlsgroupbox.setDisabled(True)
         self.positiongroupbox.setEnabled(True)
-        self.update_timer.stop()
+        self._status_active = False
         #self.nmea_thread = None
 
-    def updateRemoteThreds(new_heading, new_speed, new_altitude):
-            # Get all 'nmea_srv*' telnet server threads
-            thread_list = [thread for thread in threading.enumerate() if thread.name.startswith('nmea_srv')]
-            if thread_list:
-                for thr in thread_list:
-                    # Update speed, heading and altitude
-                    #a = time.time()
-                    thr.set_heading(new_heading)
-                    thr.set_speed(new_speed)
-                    thr.set_altitude(new_altitude)
-                    #print(time.time() - a)
-
-    def updateAltPlus(self):
-        self.nmea_obj.altitude_targeted += 1
-
-    def updateAltMinus(self):
-        self.nmea_obj.altitude_targeted -= 1
-
-    def updateSpeedPlus(self):
-        self.nmea_obj.speed_targeted += 1
+    def updateRemoteThreds(self, new_heading, new_speed, new_altitude):
+        # Drop finished output threads from the registry
+        self._nmea_workers = [thr for thr in self._nmea_workers if thr.is_alive()]
+        for thr in self._nmea_workers:
+            # Update speed, heading and altitude
+            thr.set_heading(new_heading)
+            thr.set_speed(new_speed)
+            thr.set_altitude(new_altitude)
+
+    def _bump(self, attr: str, delta: int):
+        setattr(self.nmea_obj, attr, getattr(self.nmea_obj, attr) + delta)
+
+    def _start_bump(self, attr: str, delta: int):
+        self._bump_pending = [attr, delta, delta]
+        # Repeat only after a longer first delay, so a click is one step
+        self._bump_timer.start(500)
+
+    def _repeat_bump(self):
+        self._bump_pending[2] += self._bump_pending[1]
+        self._bump_timer.setInterval(200)
+
+    def _flush_bump(self):
+        self._bump_timer.stop()
+        if self._bump_pending:
+            attr, _, total = self._bump_pending
+            self._bump_pending = None
+            self._bump(attr, total)
 
-    def updateSpeedMinus(self):
-        self.nmea_obj.speed_targeted -= 1
-
-    def updateHeadPlus(self):
-        self.nmea_obj.heading_targeted += 1
-
-    def updateHeadMinus(self):
-        self.nmea_obj.heading_targeted -= 1
-    
     def nmea_serial(self):
         """
         Runs serial which emulates NMEA server-device
@@ -652,7 +772,8 @@ class NmeaGuiApplication(QDialog):
                                        daemon=True,
                                        serial_config=self.serial_set,
                                        nmea_object=self.nmea_obj,
-                                       gui=True)
+                                       status_callback=self._status_bridge.status_changed.emit)
+        self._nmea_workers.append(self.nmea_thread)
         self.nmea_thread.start()
 
     def nmea_logging(self):
@@ -663,7 +784,8 @@ class NmeaGuiApplication(QDialog):
                                        daemon=True,
                                        filter_mess=self.filter_mess,
                                        nmea_object=self.nmea_obj,
-                                       gui=True)
+                                       status_callback=self._status_bridge.status_changed.emit)
+        self._nmea_workers.append(self.nmea_thread)
         self.nmea_thread.start()
 
     def nmea_tcp_server(self):
@@ -675,7 +797,8 @@ class NmeaGuiApplication(QDialog):
         srv_ip_address = '127.0.0.1'
         srv_port = 10110
         self.nmea_thread = threading.Thread(target=run_telnet_server_thread,
-                                            args=[srv_ip_address, srv_port, self.nmea_obj],
+                                            args=[srv_ip_address, srv_port, self.nmea_obj,
+                                                  self._status_bridge.status_changed.emit],
                                             daemon=True,
                                             name='nmea_thread')
         self.nmea_thread.start()
@@ -684,14 +807,16 @@ class NmeaGuiApplication(QDialog):
         """
         Runs TCP or UDP NMEA stream to designated host.
         """
-        ip_add = self.network_set['ip_stream']
-        port = self.network_set['port_stream']
+        ip_add = self.network_set['ip_str']
+        port = self.network_set['port_str']
         self.nmea_thread = NmeaStreamThread(name=f'nmea_srv{uuid.uuid4().hex}',
                                             daemon=True,
                                             ip_add=ip_add,
                                             port=port,
                                             proto=stream_proto,
-                                            nmea_object=self.nmea_obj)
+                                            nmea_object=self.nmea_obj,
+                                            status_callback=self._status_bridge.status_changed.emit)
+        self._nmea_workers.append(self.nmea_thread)
         self.nmea_thread.start()
 
     def quit(self):
@@ -11,7 +11,9 @@ Based on the works of luk-kop
 
 import random
 import time
-from math import ceil
+from math import ceil, copysign, cos, sin, sqrt, radians, degrees
+from functools import lru_cache, reduce
+from operator import xor
 import datetime
 from datetime import timezone
 
@@ -21,13 +23,64 @@ from pyproj import Geod
 from pygeomag import GeoMag
 from pygeomag import decimal_year_from_date
 
-from nmea_utils import ddd2nmea, ll2dir
+from nmea_utils import ddd2nmea, ll2dir, datetime2nmea
+
+# WGS84 ellipsoid and WMM model shared by all updates, the WMM
+# coefficients are loaded on first use and kept
+_GEOD = Geod(ellps='WGS84')
+_GEOMAG = GeoMag()
+# WGS84 semi-major axis and first eccentricity squared
+_WGS84_A = 6378137.0
+_WGS84_E2 = 0.00669437999014
+# Steps shorter than this (m) use the local flat-earth approximation
+_FLAT_EARTH_MAX_DISTANCE = 100.0
+# Two uppercase hex digits for every checksum byte value
+_HEX_LUT = tuple(f'{i:02X}' for i in range(256))
+# Timezone polygon data, loaded on first lookup and kept
+_TZF = None
+
+
+def _get_tzf() -> TimezoneFinder:
+    """
+    Returns the shared TimezoneFinder, created on first call.
+
+    :return: TimezoneFinder instance
+    :rtype: TimezoneFinder
+    """
+    global _TZF
+    if _TZF is None:
+        _TZF = TimezoneFinder()
+    return _TZF
+
+
+@lru_cache(maxsize=64)
+def _timezone_offset(timezone_str: str, utc_date: datetime.date) -> tuple:
+    """
+    Returns the standard (DST excluded) UTC offset of a timezone on a date,
+    cached per timezone name and date.
+
+    :param str timezone_str: IANA timezone name
+    :param date utc_date: UTC date to get the offset for
+    :return: UTC offset hours and minutes in a tuple
+    :rtype: int, int
+    """
+    # Get the local time in the timezone at noon UTC of the date
+    local_time = datetime.datetime.combine(utc_date, datetime.time(12), tzinfo=timezone.utc) \
+        .astimezone(pytz.timezone(timezone_str))
+
+    # Get the UTC offset in hours and minutes
+    utc_offset_seconds = local_time.utcoffset().total_seconds() - local_time.dst().total_seconds()
+    utc_offset_hours = int(utc_offset_seconds // 3600)
+    utc_offset_minutes = int((utc_offset_seconds % 3600) // 60)
+
+    return utc_offset_hours, utc_offset_minutes
 
 class NmeaMsg:
     """
     The class represent a group of NMEA sentences.
     """
-    def __init__(self, position_init: dict, altitude_init: float, speed_init: float, heading_init: float):
+    def __init__(self, position_init: dict, altitude_init: float, speed_init: float, heading_init: float,
+                 verbose: bool = True):
         """ Class Constructor.
 
         Creates the initial collection of NMEA messages from supplied values.
@@ -36,11 +89,15 @@ class NmeaMsg:
         :param float altitude_init: initial altitude msl float value
         :param float speed_init: initial speed float value
         :param float heading_init: initial heading float value
+        :param bool verbose: print console message when all updates are ready, defaults to True
         :return: None
         :rtype: None
         """
         # Instance attributes
         self.utc_date_time = datetime.datetime.now(timezone.utc)
+        # Monotonic clock for elapsed time, not affected by wall clock adjustments
+        self.monotonic_time = time.monotonic()
+        self.verbose = verbose
         self.position = position_init
         self.position_backup = position_init
 
@@ -58,6 +115,8 @@ class NmeaMsg:
         # The unit's speed provided by the user during the operation of the script
         self.speed = speed_init
         self.speed_targeted = speed_init
+        # Speed in m/s, updated with speed
+        self._speed_ms = speed_init * 0.514444
 
         # The unit's altitude provided by the user during the operation of the script
         self.altitude = altitude_init
@@ -67,14 +126,18 @@ class NmeaMsg:
         self.magvar = 2.1
         self.magvar_dec = 2.1
         self.magvar_direct = 'E'
+        # Latitude, longitude and decimal year of the last calculation
+        self._magvar_cache = None
         # Calculate magnetic variation once if unit is stopped to get real values
         self._magvar_update()
 
         # The unit's heading provided by the user during the operation of the script
         self.heading = heading_init
         self.heading_targeted = heading_init
+        # Heading with its sine and cosine, see position_update
+        self._heading_trig = (None, 0.0, 1.0)
         # Calculate magnetic heading from heading
-        self.heading_magnetic = self.heading - self.magvar
+        self.heading_magnetic = round(self.heading - self.magvar, 1)
 
         # NMEA sentences initialization - by default with 15 sats
         self.gpgsv_group = GpgsvGroup()
@@ -99,7 +162,8 @@ class NmeaMsg:
         # True heading
         self.gphdt = Gphdt(heading=heading_init)
         # Track Made Good and Ground Speed
-        self.gpvtg = Gpvtg(heading_true=heading_init, sog_knots=speed_init)
+        self.gpvtg = Gpvtg(heading_true=heading_init, sog_knots=speed_init,
+                           heading_magnetic=self.heading_magnetic)
         # Time and zone
         self.gpzda = Gpzda(utc_date_time=self.utc_date_time,
                            offset_hrs=timezone_offset_hours,
@@ -107,95 +171,103 @@ class NmeaMsg:
         # Change in progress flag
         self.change_in_progress = False
         # All sentences
-        self.nmea_sentences = [self.gpgga,
+        self.nmea_sentences = (self.gpgga,
                                self.gpgsa,
-                               *[gpgsv for gpgsv in self.gpgsv_group.gpgsv_instances],
+                               *self.gpgsv_group.gpgsv_instances,
                                self.gpgll,
                                self.gprmc,
                                self.gphdt,
                                self.gpvtg,
-                               self.gpzda,]
-        # print(self.position)
+                               self.gpzda)
 
     def __next__(self):
         """ Iterator function.
 
         Calculates the next values for generation of NMEA messages.
 
-        :return: list of NMEA messages
-        :rtype: list
+        :return: tuple of NMEA messages
+        :rtype: tuple
         """
-        # Get time of last execution
-        utc_date_time_prev = self.utc_date_time
+        # Get time elapsed since last execution
+        monotonic_time_prev = self.monotonic_time
+        self.monotonic_time = time.monotonic()
         self.utc_date_time = datetime.datetime.now(timezone.utc)
-        # If unit is moving update position
+        # Values the magnetic heading is calculated from
+        heading_prev = self.heading
+        magvar_prev = self.magvar
+        magvar_direct_prev = self.magvar_direct
+        # If unit is moving update position, a stopped unit keeps its NMEA position fields
         if self.speed > 0:
-            self.position_update(utc_date_time_prev)
+            self.position_update(self.monotonic_time - monotonic_time_prev)
             # Update magnetic variation value
             self._magvar_update()
+            # Get new position and update NMEA form and direction in dictionary
+            lat = self.position['lat']
+            lon = self.position['lng']
+            self.position['lat_nmea'] = ddd2nmea(lat, 'lat')
+            self.position['lng_nmea'] = ddd2nmea(lon, 'lng')
+            self.position['lat_dir'] = ll2dir(lat, 'lat')
+            self.position['lng_dir'] = ll2dir(lon, 'lng')
 
         # Update heading and set progress flag
         if self.heading != self.heading_targeted:
             self.change_in_progress = True
             self._heading_update()
+            self.gprmc.cmg = self.heading
+            self.gphdt.heading = self.heading
+            self.gpvtg.heading_true = self.heading
 
         # Update speed and set progress flag
         if self.speed != self.speed_targeted:
             self.change_in_progress = True
             self._speed_update()
+            self.gprmc.sog = self.speed
+            self.gpvtg.sog_knots = self.speed
 
         # Update altitude and set progress flag
         if self.altitude != self.altitude_targeted:
             self.change_in_progress = True
             self._altitude_update()
+            self.gpgga.altitude = self.altitude
+            self.gpgga.antenna_altitude_above_msl = self.altitude + 2.5
+
+        # Update magnetic variation only when changed
+        if self.magvar != magvar_prev or self.magvar_direct != magvar_direct_prev:
+            self.gprmc.magnetic_var_value = self.magvar
+            self.gprmc.magnetic_var_direct = self.magvar_direct
+
+        # Update magnetic heading only when heading or variation changed
+        if self.heading != heading_prev or self.magvar != magvar_prev:
+            self.heading_magnetic = round(self.heading - self.magvar, 1)
+            self.gpvtg.heading_magnetic = self.heading_magnetic
 
-        # Get new position and update NMEA form and direction in dictionary
-        lat = self.position['lat']
-        lon = self.position['lng']
-        self.position['lat_nmea'] = ddd2nmea(lat, 'lat')
-        self.position['lng_nmea'] = ddd2nmea(lon, 'lng')
-        self.position['lat_dir'] = ll2dir(lat, 'lat')
-        self.position['lng_dir'] = ll2dir(lon, 'lng')
-        
         # All updates done, print message
         if self.change_in_progress == True \
              and self.heading == self.heading_targeted \
              and self.speed == self.speed_targeted \
              and self.altitude == self.altitude_targeted:
             self.change_in_progress = False
-            print('\n All updates ready...')
-            #print(f" Latitude: {self.position['lat']}°{self.position['lat_dir']}")
-            #print(f" Longitude: {self.position['lng']}°{self.position['lng_dir']}")
-            print(f" Altitude: {self.altitude} m")
-            print(f" Speed: {self.speed} kt")
-            print(f" Heading: {self.heading}°")
-            print("\n Press \"Enter\" to change course/speed/altitude or \"Ctrl + c\" to exit...\n")
+            if self.verbose:
+                # Single write to the console
+                print(f'\n All updates ready...\n'
+                      f' Altitude: {self.altitude} m\n'
+                      f' Speed: {self.speed} kt\n'
+                      f' Heading: {self.heading}°\n'
+                      '\n Press "Enter" to change course/speed/altitude or "Ctrl + c" to exit...\n')
             
-        # Set new values in messages
-        self.gpgga.utc_time = self.utc_date_time
-        self.gpgga.altitude = self.altitude
-        self.gpgga.antenna_altitude_above_msl = self.altitude + 2.5
-        self.gpgll.utc_time = self.utc_date_time
-        self.gprmc.utc_time = self.utc_date_time
-        self.gprmc.sog = self.speed
-        self.gprmc.cmg = self.heading
-        self.gprmc.magnetic_var_value = self.magvar
-        self.gprmc.magnetic_var_direct = self.magvar_direct
-        self.gphdt.heading = self.heading
-        self.gpvtg.heading_true = self.heading
-        self.gpvtg.heading_magnetic = round(self.heading - self.magvar, 1)
-        self.gpvtg.sog_knots = self.speed
-        self.gpzda.utc_time = self.utc_date_time
+        # Set new time in messages, other values are set above when changed
+        nmea_time = datetime2nmea(self.utc_date_time)
+        self.gpgga.set_utc(nmea_time)
+        self.gpgll.set_utc(nmea_time)
+        self.gprmc.set_utc(nmea_time)
+        self.gpzda.set_utc(nmea_time)
         return self.nmea_sentences
 
     def __iter__(self):
         return self
 
     def __str__(self):
-        nmea_msgs_str = ''
-        for nmea in self.nmea_sentences:
-            nmea_msgs_str += f'{nmea}'
-        return nmea_msgs_str
+        return ''.join(map(str, self.nmea_sentences))
     
     def get_timezone_offset(self, lat, lng):
         """
@@ -206,52 +278,51 @@ class NmeaMsg:
         :return: UTC offset hours and minutes in a tuple
         :rtype: int, int
         """
-        # Initialize TimezoneFinder
-        tzf = TimezoneFinder()
-
         # Get the timezone name from latitude and longitude
-        timezone_str = tzf.timezone_at(lng=lng, lat=lat)
+        timezone_str = _get_tzf().timezone_at(lng=lng, lat=lat)
 
         if timezone_str is None:
             return None, None
 
-        # Get the timezone object from pytz
-        pytz_tz = pytz.timezone(timezone_str)
-
-        # Get the current time in the timezone
-        current_time = datetime.datetime.now(pytz_tz)
-
-        # Get the UTC offset in hours and minutes
-        utc_offset_seconds = current_time.utcoffset().total_seconds() - current_time.dst().total_seconds()
-        utc_offset_hours = int(utc_offset_seconds // 3600)
-        utc_offset_minutes = int((utc_offset_seconds % 3600) // 60)
-
-        return utc_offset_hours, utc_offset_minutes
+        # Offset of the timezone on the current UTC date
+        return _timezone_offset(timezone_str, self.utc_date_time.date())
     
-    def position_update(self, utc_date_time_prev: datetime):
+    def position_update(self, time_delta: float):
         """
         Update position when unit in move.
 
-        :param datetime utc_date_time_prev: datetime object representing the last time function was called
+        :param float time_delta: seconds elapsed since the last time function was called
         :return: None
         :rtype: None
         """
-        # The time that has elapsed since the last fix
-        time_delta = (self.utc_date_time - utc_date_time_prev).total_seconds()
-        # Knots to m/s conversion.
-        speed_ms = self.speed * 0.514444
         # Distance in meters.
-        distance = speed_ms * time_delta
+        distance = self._speed_ms * time_delta
         
         # Assignment of old coords.
         lat_start = self.position['lat']
         lon_start = self.position['lng']
         
-        # Use WGS84 ellipsoid
-        g = Geod(ellps='WGS84')
-
-        # Forward transformation - returns longitude, latitude, back azimuth of terminus points
-        lon_end, lat_end, back_azimuth = g.fwd(lon_start, lat_start, self.heading, distance)
+        if distance < _FLAT_EARTH_MAX_DISTANCE and abs(lat_start) < 89:
+            # Short step, move along the local meridian and prime vertical radii of curvature
+            lat_rad = radians(lat_start)
+            # Heading sine and cosine are kept while the heading is steady
+            if self._heading_trig[0] != self.heading:
+                heading_rad = radians(self.heading)
+                self._heading_trig = (self.heading, sin(heading_rad), cos(heading_rad))
+            heading_sin, heading_cos = self._heading_trig[1:]
+            curvature = 1 - _WGS84_E2 * sin(lat_rad) ** 2
+            radius_prime_vertical = _WGS84_A / sqrt(curvature)
+            radius_meridian = radius_prime_vertical * (1 - _WGS84_E2) / curvature
+            lat_end = lat_start + degrees(distance * heading_cos / radius_meridian)
+            lon_end = lon_start + degrees(distance * heading_sin / (radius_prime_vertical * cos(lat_rad)))
+            # Longitude range: -180-180
+            if lon_end > 180:
+                lon_end -= 360
+            elif lon_end < -180:
+                lon_end += 360
+        else:
+            # Forward transformation on WGS84 ellipsoid - returns longitude, latitude, back azimuth of terminus points
+            lon_end, lat_end, _ = _GEOD.fwd(lon_start, lat_start, self.heading, distance)
 
         # Store the new position
         self.position['lat'] = lat_end 
@@ -264,47 +335,22 @@ class NmeaMsg:
         :return: None
         :rtype: None
         """
-        # Get active values
-        head_target = self.heading_targeted
+        # Get active values, target is kept in range 0-359 so it compares equal to the heading
+        head_target = self.heading_targeted % 360
+        self.heading_targeted = head_target
         head_current = self.heading
-        turn_angle = head_target - head_current
+        # Shortest turn towards target in range -180-180
+        turn_angle = (head_target - head_current + 540) % 360 - 180
         # Heading increment in each update
         heading_increment = 3
-        # Immediate change of course when the head_increment <= turn_angle
+        # Immediate change of course when the turn_angle <= heading_increment
         if abs(turn_angle) <= heading_increment:
             head_current = head_target
         else:
-            # The unit's heading is increased gradually (with 'heading_increment')
-            if head_target > head_current:
-                if abs(turn_angle) > 180:
-                    if turn_angle > 0:
-                        head_current -= heading_increment
-                    else:
-                        head_current += heading_increment
-                else:
-                    if turn_angle > 0:
-                        head_current += heading_increment
-                    else:
-                        head_current -= heading_increment
-            else:
-                if abs(turn_angle) > 180:
-                    if turn_angle > 0:
-                        head_current -= heading_increment
-                    else:
-                        head_current += heading_increment
-                else:
-                    if turn_angle > 0:
-                        head_current += heading_increment
-                    else:
-                        head_current -= heading_increment
-        # Heading range: 0-359
-        if head_current == 360:
-            head_current = 0
-        elif head_current > 360:
-            head_current -= 360
-        elif head_current < 0:
-            head_current += 360
-        self.heading = round(head_current, 1)
+            # The unit's heading is changed gradually (with 'heading_increment'), range: 0-359
+            head_current = (head_current + copysign(heading_increment, turn_angle)) % 360
+        # Heading range: 0-359, also after rounding up to 360
+        self.heading = round(head_current, 1) % 360
 
     def _speed_update(self):
         """
@@ -328,6 +374,8 @@ class NmeaMsg:
             speed_current -= speed_increment
             #print(f'Decrease to {speed_current} towards {speed_target}')
         self.speed = round(speed_current, 1)
+        # Knots to m/s conversion.
+        self._speed_ms = self.speed * 0.514444
 
     def _altitude_update(self):
         """
@@ -359,13 +407,19 @@ class NmeaMsg:
         :return: None
         :rtype: None
         """
+        lat = self.position['lat']
+        lon = self.position['lng']
+        date_decimal = decimal_year_from_date(self.utc_date_time)
+        # The variation changes slowly, skip recalculation within ~1 km and 1 day
+        if self._magvar_cache is not None:
+            lat_cached, lon_cached, date_cached = self._magvar_cache
+            if abs(lat - lat_cached) < 0.01 and abs(lon - lon_cached) < 0.01 \
+                    and abs(date_decimal - date_cached) < 1 / 365:
+                return
+        self._magvar_cache = (lat, lon, date_decimal)
         try:
-            date_decimal = decimal_year_from_date(self.utc_date_time)
-            lat = self.position['lat']
-            lon = self.position['lng']
             alt = self.altitude
-            gm = GeoMag()
-            result = gm.calculate(glat=lat, glon=lon, alt=alt, time=date_decimal)
+            result = _GEOMAG.calculate(glat=lat, glon=lon, alt=alt, time=date_decimal)
             self.magvar = abs(result.d)
             self.magvar_dec = result.d
             if result.d > 0:
@@ -388,88 +442,11 @@ class NmeaMsg:
         :return: Checksum
         :rtype: str
         """
-        check_sum: int = 0
-        for char in data:
-            num = bytearray(char, encoding='utf-8')[0]
-            # XOR operation.
-            check_sum = (check_sum ^ num)
-        # Returns only hex digits string without leading 0x.
-        hex_str: str = str(hex(check_sum))[2:]
-        if len(hex_str) == 2:
-            return hex_str.upper()
-        return f'0{hex_str}'.upper()
-    
-    @property
-    def get_latitude(self) -> float:
-        """ Property getter for latitude variable
-        
-        :return: float latitude value
-        :rtype: float
-        """
-        return self.position['lat']
-
-    @property
-    def get_longitude(self) -> float:
-        """ Property getter for longitude variable
-        
-        :return: float longitude value
-        :rtype: float
-        """
-        return self.position['lng']
-
-    @property
-    def get_speed(self) -> float:
-        """ Property getter for speed variable
-        
-        :return: float speed value
-        :rtype: float
-        """
-        return self.speed
+        # XOR operation over all bytes.
+        check_sum: int = reduce(xor, data.encode(), 0)
+        # Returns two uppercase hex digits without leading 0x.
+        return _HEX_LUT[check_sum]
 
-    @property
-    def get_heading(self) -> float:
-        """ Property getter for heading variable
-        
-        :return: float heading value
-        :rtype: float
-        """
-        return self.heading
-
-    @property
-    def get_altitude(self) -> float:
-        """ Property getter for altitude variable
-        
-        :return: float altitude value
-        :rtype: float
-        """
-        return self.altitude
-    
-    @property
-    def get_targetspeed(self) -> float:
-        """ Property getter for target speed variable
-        
-        :return: float speed value
-        :rtype: float
-        """
-        return self.speed_targeted
-    
-    @property
-    def get_targetheading(self) -> float:
-        """ Property getter for target heading variable
-        
-        :return: float heading value
-        :rtype: float
-        """
-        return self.heading_targeted
-    
-    @property
-    def get_targetaltitudedef(self) -> float:
-        """ Property getter for target altitude variable
-        
-        :return: float altitude value
-        :rtype: float
-        """
-        return self.altitude_targeted
 
 class Gpgga:
     """
@@ -508,6 +485,8 @@ class Gpgga:
     15 	The checksum data, always begins with *
     """
     sentence_id: str = 'GPGGA'
+    __slots__ = ('sats_count', '_utc_time', 'position', 'fix_quality', 'hdop', 'altitude',
+                 'antenna_altitude_above_msl', 'dgps_last_update', 'dgps_ref_station_id')
 
     def __init__(self, sats_count: int, utc_date_time: datetime,
                  position: dict, altitude: float, 
@@ -529,7 +508,7 @@ class Gpgga:
         :param str dgps_ref_station_id: reference station ID, range 0000 to 4095, defaults to empty string
         """
         self.sats_count = sats_count
-        self.utc_time = utc_date_time
+        self.set_utc(datetime2nmea(utc_date_time))
         self.position = position
         self.fix_quality = fix_quality
         self.hdop = hdop
@@ -542,9 +521,9 @@ class Gpgga:
     def utc_time(self) -> str:
         return self._utc_time
 
-    @utc_time.setter
-    def utc_time(self, value) -> None:
-        self._utc_time = value.strftime('%H%M%S')
+    def set_utc(self, nmea_time: tuple) -> None:
+        # Strings from datetime2nmea, formatted once per update
+        self._utc_time = nmea_time[0]
 
     def __str__(self) -> str:
         nmea_output = f'{self.sentence_id},{self.utc_time}.00,{self.position["lat_nmea"]},' \
@@ -582,6 +561,7 @@ class Gpgll:
         N: Data not valid
     """
     sentence_id: str = 'GPGLL'
+    __slots__ = ('_utc_time', 'position', 'data_status', 'faa_mode', '_last_key', '_last_str')
 
     def __init__(self, utc_date_time, position, data_status='A', faa_mode='A'):
         """ GPGLL Class Constructor.
@@ -594,26 +574,34 @@ class Gpgll:
         :param str faa_mode: FAA Mode option
         """
         # UTC time in format: 211250
-        self.utc_time = utc_date_time
+        self.set_utc(datetime2nmea(utc_date_time))
         self.position = position
         self.data_status = data_status
         # FAA Mode option in NMEA 2.3 and later
         self.faa_mode = faa_mode
+        # Last rendered sentence and the values it was rendered from
+        self._last_key = None
+        self._last_str = ''
 
     @property
     def utc_time(self) -> str:
         return self._utc_time
 
-    @utc_time.setter
-    def utc_time(self, value) -> None:
-        self._utc_time = value.strftime('%H%M%S')
+    def set_utc(self, nmea_time: tuple) -> None:
+        # Strings from datetime2nmea, formatted once per update
+        self._utc_time = nmea_time[0]
 
     def __str__(self):
-        nmea_output = f'{self.sentence_id},{self.position["lat_nmea"]},' \
-                      f'{self.position["lat_dir"]},{self.position["lng_nmea"]},' \
-                      f'{self.position["lng_dir"]},{self.utc_time}.000,' \
-                      f'{self.data_status},{self.faa_mode}'
-        return f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+        key = (self.utc_time, self.position["lat_nmea"], self.position["lat_dir"],
+               self.position["lng_nmea"], self.position["lng_dir"], self.data_status, self.faa_mode)
+        if key != self._last_key:
+            nmea_output = f'{self.sentence_id},{self.position["lat_nmea"]},' \
+                          f'{self.position["lat_dir"]},{self.position["lng_nmea"]},' \
+                          f'{self.position["lng_dir"]},{self.utc_time}.000,' \
+                          f'{self.data_status},{self.faa_mode}'
+            self._last_str = f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+            self._last_key = key
+        return self._last_str
 
 class Gprmc:
     """
@@ -632,6 +620,8 @@ class Gprmc:
     9 	The checksum data, always begins with *
     """
     sentence_id = 'GPRMC'
+    __slots__ = ('_utc_time', '_utc_date', 'data_status', 'position', 'sog',
+                 'magnetic_var_value', 'magnetic_var_direct', 'cmg', 'faa_mode')
 
     def __init__(self, utc_date_time, position, sog, cmg, data_status='A', faa_mode='A',
                   magnetic_var_value=0.0, magnetic_var_direct='E'):
@@ -649,7 +639,7 @@ class Gprmc:
         :param str magnetic_var_direct: direction of magnetic variation
         """
         # UTC time in format: 211250
-        self.utc_time = utc_date_time
+        self.set_utc(datetime2nmea(utc_date_time))
         # UTC date in format: 130720
         self.data_status = data_status
         self.position = position
@@ -667,19 +657,15 @@ class Gprmc:
     def utc_time(self) -> str:
         return self._utc_time
 
-    @utc_time.setter
-    def utc_time(self, value) -> None:
-        self._utc_time = value.strftime('%H%M%S')
-        self._utc_date = value.strftime('%d%m%y')
+    def set_utc(self, nmea_time: tuple) -> None:
+        # Strings from datetime2nmea, formatted once per update
+        self._utc_time, self._utc_date, _ = nmea_time
 
     @property
     def utc_date(self) -> str:
+        # Set together with utc_time by set_utc
         return self._utc_date
 
-    @utc_date.setter
-    def utc_date(self, value) -> None:
-        self._utc_date = value.strftime('%d%m%y')
-
     def __str__(self):
         nmea_output = f'{self.sentence_id},{self.utc_time}.000,{self.data_status},' \
                       f'{self.position["lat_nmea"]},{self.position["lat_dir"]},' \
@@ -711,6 +697,7 @@ class Gpgsa:
     7 	The checksum data, always begins with *
     """
     sentence_id: str = 'GPGSA'
+    __slots__ = ('select_mode', 'mode', 'pdop', 'hdop', 'vdop', 'sats_in_view', '_sats_ids', '_cached')
 
     def __init__(self, gpgsv_group, select_mode: str='A', mode: int=3, pdop: float=1.56, hdop: float=0.92, vdop: float=1.25):
         """ GPGSA Class Constructor.
@@ -726,10 +713,12 @@ class Gpgsa:
         """
         self.select_mode = select_mode
         self.mode = mode
-        self.sats_ids = gpgsv_group.sats_ids
         self.pdop = pdop
         self.hdop = hdop
         self.vdop = vdop
+        # Satellites in view, the ones used in fix are picked from these
+        self.sats_in_view = gpgsv_group.sats_ids
+        self.reseed_sats()
 
     @property
     def sats_ids(self) -> list:
@@ -737,22 +726,34 @@ class Gpgsa:
 
     @sats_ids.setter
     def sats_ids(self, value) -> None:
-        self._sats_ids = random.sample(value, k=random.randint(4, 12))
+        self._sats_ids = list(value)
+        # Satellites are fixed until set again, render the sentence once here
+        self._cached = self._render()
+
+    def reseed_sats(self) -> None:
+        """
+        Picks a random set of 4 to 12 satellites in view as the satellites used in fix.
+
+        :return: None
+        :rtype: None
+        """
+        self.sats_ids = random.sample(self.sats_in_view, k=random.randint(4, 12))
 
     @property
     def sats_count(self) -> int:
         return len(self.sats_ids)
 
-    def __str__(self) -> str:
+    def _render(self) -> str:
         # IDs of sat used in position fix (12 fields), if less than 12 sats, fill fields with ''
-        sats_ids_output = self.sats_ids[:]
-        while len(sats_ids_output) < 12:
-            sats_ids_output.append('')
+        sats_ids_output = ','.join(self.sats_ids + [''] * (12 - len(self.sats_ids)))
         nmea_output = f'{self.sentence_id},{self.select_mode},{self.mode},' \
-                      f'{",".join(sats_ids_output)},' \
+                      f'{sats_ids_output},' \
                       f'{self.pdop},{self.hdop},{self.vdop}'
         return f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
 
+    def __str__(self) -> str:
+        return self._cached
+
 class GpgsvGroup:
     """
     The class initializes the relevant number of GPGSV sentences depending
@@ -798,10 +799,7 @@ class GpgsvGroup:
             self._sats_total = value
 
     def __str__(self) -> str:
-        gpgsv_group_str = ''
-        for gpgsv in self.gpgsv_instances:
-            gpgsv_group_str += f'{gpgsv}'
-        return gpgsv_group_str
+        return ''.join(map(str, self.gpgsv_instances))
 
 class Gpgsv:
     """
@@ -822,6 +820,8 @@ class Gpgsv:
     20 	The checksum data, always begins with *
     """
     sentence_id: str = 'GPGSV'
+    __slots__ = ('num_of_gsv_in_group', 'sentence_num', 'sats_total', 'sats_in_sentence',
+                 'sats_ids', 'sats_details', '_cached')
 
     def __init__(self, num_of_gsv_in_group, sentence_num, sats_total, sats_in_sentence, sats_ids):
         """ GPGSV Class Constructor.
@@ -839,18 +839,21 @@ class Gpgsv:
         self.sats_total = sats_total
         self.sats_in_sentence = sats_in_sentence
         self.sats_ids = sats_ids
-        self.sats_details = ''
+        sats_details = []
         for sat in self.sats_ids:
             satellite_id: str = sat
             elevation: int = random.randint(0, 90)
             azimuth: int = random.randint(0, 359)
             snr: int = random.randint(0, 99)
-            self.sats_details += f',{satellite_id},{elevation:02d},{azimuth:03d},{snr:02d}'
-
-    def __str__(self) -> str:
+            sats_details.append(f',{satellite_id},{elevation:02d},{azimuth:03d},{snr:02d}')
+        self.sats_details = ''.join(sats_details)
+        # Satellite data is fixed after init, render the sentence once here
         nmea_output = f'{self.sentence_id},{self.num_of_gsv_in_group},{self.sentence_num},' \
                       f'{self.sats_total}{self.sats_details}'
-        return f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+        self._cached = f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+
+    def __str__(self) -> str:
+        return self._cached
 
 
 class Gphdt:
@@ -865,6 +868,7 @@ class Gphdt:
     3 	The checksum data, always begins with *
     """
     sentence_id = 'GPHDT'
+    __slots__ = ('heading', '_last_key', '_last_str')
 
     def __init__(self, heading):
         """ GPHDT Class Constructor.
@@ -874,10 +878,16 @@ class Gphdt:
         :param float heading: Unit's heading
         """
         self.heading = heading
+        # Last rendered sentence and the heading it was rendered from
+        self._last_key = None
+        self._last_str = ''
 
     def __str__(self):
-        nmea_output = f'{self.sentence_id},{self.heading},T'
-        return f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+        if self.heading != self._last_key:
+            nmea_output = f'{self.sentence_id},{self.heading},T'
+            self._last_str = f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+            self._last_key = self.heading
+        return self._last_str
 
 
 class Gpvtg:
@@ -904,6 +914,7 @@ class Gpvtg:
     10 	The checksum data, always begins with *
     """
     sentence_id = 'GPVTG'
+    __slots__ = ('heading_true', 'heading_magnetic', 'sog_knots', '_last_key', '_last_str')
 
     def __init__(self, heading_true: float, sog_knots: float, heading_magnetic: float = 0.0) -> None:
         """ GPVTG Class Constructor.
@@ -917,6 +928,9 @@ class Gpvtg:
         self.heading_true = heading_true
         self.heading_magnetic = heading_magnetic
         self.sog_knots = sog_knots
+        # Last rendered sentence and the values it was rendered from
+        self._last_key = None
+        self._last_str = ''
 
     @property
     def sog_kmhr(self) -> float:
@@ -926,9 +940,13 @@ class Gpvtg:
         return round(self.sog_knots * 1.852, 1)
 
     def __str__(self) -> str:
-        nmea_output = f'{self.sentence_id},{self.heading_true},T,{self.heading_magnetic},M,' \
-                      f'{self.sog_knots},N,{self.sog_kmhr},K'
-        return f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+        key = (self.heading_true, self.heading_magnetic, self.sog_knots)
+        if key != self._last_key:
+            nmea_output = f'{self.sentence_id},{self.heading_true},T,{self.heading_magnetic},M,' \
+                          f'{self.sog_knots},N,{self.sog_kmhr},K'
+            self._last_str = f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+            self._last_key = key
+        return self._last_str
 
 
 class Gpzda:
@@ -939,6 +957,7 @@ class Gpzda:
 
     """
     sentence_id = 'GPZDA'
+    __slots__ = ('_utc_time', '_utc_date', 'offset_hrs', 'offset_min', '_last_key', '_last_str')
 
     def __init__(self, utc_date_time, offset_hrs:int=0, offset_min:int=0):
         """ GPZDA Class Constructor.
@@ -948,30 +967,33 @@ class Gpzda:
         :param datetime utc_date_time: Datetime object to use
         """
         # UTC time in format: 211250
-        self.utc_time = utc_date_time
+        self.set_utc(datetime2nmea(utc_date_time))
         self.offset_hrs = offset_hrs
         self.offset_min = offset_min
+        # Last rendered sentence and the values it was rendered from
+        self._last_key = None
+        self._last_str = ''
 
     @property
     def utc_time(self) -> str:
         return self._utc_time
 
-    @utc_time.setter
-    def utc_time(self, value) -> None:
-        self._utc_time = value.strftime('%H%M%S')
-        self._utc_date = value.strftime('%d,%m,%Y')
+    def set_utc(self, nmea_time: tuple) -> None:
+        # Strings from datetime2nmea, formatted once per update
+        self._utc_time, _, self._utc_date = nmea_time
 
     @property
     def utc_date(self) -> str:
+        # Set together with utc_time by set_utc
         return self._utc_date
 
-    @utc_date.setter
-    def utc_date(self, value) -> None:
-        self._utc_date = value.strftime('%d,%m,%Y')
-
     def __str__(self):
-        # Local timezone is always the os timezone, not the position
-        nmea_output = f'{self.sentence_id},{self.utc_time}.000,{self.utc_date},' \
-                      f'{self.offset_hrs:+03},{self.offset_min:02}'
-        return f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+        key = (self.utc_time, self.utc_date, self.offset_hrs, self.offset_min)
+        if key != self._last_key:
+            # Local timezone is always the os timezone, not the position
+            nmea_output = f'{self.sentence_id},{self.utc_time}.000,{self.utc_date},' \
+                          f'{self.offset_hrs:+03},{self.offset_min:02}'
+            self._last_str = f'${nmea_output}*{NmeaMsg.check_sum(nmea_output)}\r\n'
+            self._last_key = key
+        return self._last_str
 
@@ -145,4 +145,17 @@ def date2str(dat: datetime.date, form: str = 'dt') -> str:
         dform = "%m%d%y" if form == 'dm' else "%d%m%y"
         return dat.strftime(dform)
     except (AttributeError, TypeError, ValueError):
-        return ""
\ No newline at end of file
+        return ""
+
+
+def datetime2nmea(dat: datetime) -> tuple:
+    """
+    Convert datetime to NMEA formatted time and date strings.
+
+    :param datetime dat: datetime
+    :return: time hhmmss, date ddmmyy and date dd,mm,yyyy strings
+    :rtype: tuple
+    """
+    return (f'{dat.hour:02d}{dat.minute:02d}{dat.second:02d}',
+            f'{dat.day:02d}{dat.month:02d}{dat.year % 100:02d}',
+            f'{dat.day:02d},{dat.month:02d},{dat.year:04d}')
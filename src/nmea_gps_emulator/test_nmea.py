@@ -25,9 +25,11 @@ $GPZDA,083840.855497,06,09,2024,+01,00*70
  
 import unittest
 from unittest import mock
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from nmea_gps import NmeaMsg, Gprmc, Gpgga, Gpzda, Gphdt, Gpgll, GpgsvGroup
+from nmea_gps import NmeaMsg, Gprmc, Gpgga, Gpzda, Gphdt, Gpgll, GpgsvGroup, Gpgsa, _GEOD, \
+    _timezone_offset
+from nmea_utils import datetime2nmea
 
 class TestNmeaGps(unittest.TestCase):
     """
@@ -53,6 +55,13 @@ class TestNmeaGps(unittest.TestCase):
         check_sum = NmeaMsg.check_sum(test_data)
         self.assertEqual(check_sum, "08")
 
+    def test_datetime2nmea(self):
+        expected = ('083840', '060924', '06,09,2024')
+        self.assertEqual(datetime2nmea(self.time), expected)
+        # Two-digit year wraps to 00
+        expected = ('030405', '020100', '02,01,2000')
+        self.assertEqual(datetime2nmea(datetime(2000, 1, 2, 3, 4, 5)), expected)
+
     def test_gprmc_str(self):
         expected = '$GPRMC,083840.000,A,5002.31537,N,00833.57615,E,0.000,90.0,060924,000.00,E,A*0E\r\n'
         test_obj = Gprmc(utc_date_time=self.time,
@@ -85,6 +94,100 @@ class TestNmeaGps(unittest.TestCase):
                          position=self.position)
         self.assertEqual(test_obj.__str__(), expected)
 
+    def test_heading_update(self):
+        nmea_msg = NmeaMsg(position_init=dict(self.position), altitude_init=self.altitude,
+                           speed_init=self.speed, heading_init=self.course)
+        # Heading, target, heading and target after one update
+        cases = [(359, 360, 0, 0),
+                 (0, -1, 359, 359),
+                 (359, 1, 1, 1),
+                 (0, 180, 357, 180),
+                 (10, -10, 7, 350)]
+        for heading, target, expected_heading, expected_target in cases:
+            with self.subTest(heading=heading, target=target):
+                nmea_msg.heading = heading
+                nmea_msg.heading_targeted = target
+                nmea_msg._heading_update()
+                self.assertEqual(nmea_msg.heading, expected_heading)
+                self.assertEqual(nmea_msg.heading_targeted, expected_target)
+        # Heading stays in range 0-359 during a whole turn
+        nmea_msg.heading = 0
+        nmea_msg.heading_targeted = 180
+        for _ in range(61):
+            nmea_msg._heading_update()
+            self.assertTrue(0 <= nmea_msg.heading < 360)
+        self.assertEqual(nmea_msg.heading, 180)
+
+    def test_position_update_flat_earth(self):
+        nmea_msg = NmeaMsg(position_init=dict(self.position), altitude_init=self.altitude,
+                           speed_init=self.speed, heading_init=self.course, verbose=False)
+        # 90 m step, just under the flat-earth limit
+        nmea_msg._speed_ms = 45.0
+        # Latitude, longitude and heading of the start point
+        cases = [(0.0, 8.5, 0.0),
+                 (50.0, 8.5, 45.0),
+                 (60.0, -20.0, 135.0),
+                 (-70.0, 100.0, 270.0),
+                 (88.5, 0.0, 200.0),
+                 (10.0, 179.9995, 90.0),
+                 (-10.0, -179.9995, 270.0)]
+        for lat, lng, heading in cases:
+            with self.subTest(lat=lat, lng=lng, heading=heading):
+                nmea_msg.position['lat'] = lat
+                nmea_msg.position['lng'] = lng
+                nmea_msg.heading = heading
+                nmea_msg.position_update(2.0)
+                lng_end, lat_end, _ = _GEOD.fwd(lng, lat, heading, 90.0)
+                self.assertTrue(-180 <= nmea_msg.position['lng'] <= 180)
+                # Distance between the approximated and the ellipsoid end points
+                _, _, error = _GEOD.inv(lng_end, lat_end,
+                                        nmea_msg.position['lng'], nmea_msg.position['lat'])
+                self.assertLess(error, 0.05)
+
+    @mock.patch('nmea_gps._GEOMAG')
+    def test_magvar_update_gate(self, mock_geomag):
+        mock_geomag.calculate.return_value.d = -3.5
+        nmea_msg = NmeaMsg(position_init=dict(self.position), altitude_init=self.altitude,
+                           speed_init=self.speed, heading_init=self.course, verbose=False)
+        self.assertEqual(mock_geomag.calculate.call_count, 1)
+        self.assertEqual((nmea_msg.magvar, nmea_msg.magvar_direct), (3.5, 'W'))
+        # Within ~1 km of the last calculation the variation is kept
+        nmea_msg.position['lat'] += 0.005
+        nmea_msg.position['lng'] -= 0.005
+        nmea_msg._magvar_update()
+        self.assertEqual(mock_geomag.calculate.call_count, 1)
+        # Moving further recalculates
+        nmea_msg.position['lng'] += 0.02
+        nmea_msg._magvar_update()
+        self.assertEqual(mock_geomag.calculate.call_count, 2)
+        # So does a new day at the same position
+        nmea_msg.utc_date_time += timedelta(days=2)
+        nmea_msg._magvar_update()
+        self.assertEqual(mock_geomag.calculate.call_count, 3)
+
+    def test_timezone_offset(self):
+        _timezone_offset.cache_clear()
+        # Standard offsets, daylight saving time excluded
+        self.assertEqual(_timezone_offset('Europe/Berlin', self.time.date()), (1, 0))
+        self.assertEqual(_timezone_offset('Europe/Berlin', datetime(2024, 1, 15).date()), (1, 0))
+        self.assertEqual(_timezone_offset('Asia/Kolkata', self.time.date()), (5, 30))
+        # Same timezone and date is looked up once
+        self.assertEqual(_timezone_offset('Europe/Berlin', self.time.date()), (1, 0))
+        self.assertEqual(_timezone_offset.cache_info().hits, 1)
+        self.assertEqual(_timezone_offset.cache_info().misses, 3)
+
+    def test_gpgsa_reseed_sats(self):
+        gpgsv_group = GpgsvGroup(sats_total=15)
+        gpgsa = Gpgsa(gpgsv_group=gpgsv_group)
+        self.assertTrue(4 <= gpgsa.sats_count <= 12)
+        self.assertTrue(set(gpgsa.sats_ids) <= set(gpgsv_group.sats_ids))
+        # Satellites used in fix stay the same between outputs
+        self.assertEqual(str(gpgsa), str(gpgsa))
+        with mock.patch('random.randint', return_value=4), \
+                mock.patch('random.sample', return_value=['04', '30', '06', '18']):
+            gpgsa.reseed_sats()
+        self.assertEqual(str(gpgsa), '$GPGSA,A,3,04,30,06,18,,,,,,,,,1.56,0.92,1.25*05\r\n')
+
     @mock.patch('random.randint')
     @mock.patch('random.sample')
     def test_gpgsv_group(self, mock_random_sample, mock_random_randint):